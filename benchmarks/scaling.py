@@ -0,0 +1,114 @@
+"""Benchmark board construction and solving across board sizes.
+
+Each puzzle is a shuffled pattern grid with a fraction of its cells emptied, so the
+sizes are comparable and the run is reproducible from the seed. Run from the
+repository root::
+
+    python benchmarks/scaling.py --sizes 4 9 16 25 --holes 0.5 --solver dlx
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from models import Board
+from models.topology import box_shape
+from solver import (
+    BacktrackingSolver,
+    DLXSolver,
+    ParallelBacktrackingSolver,
+    RestartPolicy,
+    Solver,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SOLVERS: dict[str, Callable[[], Solver]] = {
+    "backtracking": BacktrackingSolver,
+    "dlx": DLXSolver,
+    "parallel": ParallelBacktrackingSolver,
+    # Seeded, so that runs stay comparable
+    "restarts": partial(BacktrackingSolver, restarts=RestartPolicy(seed=0)),
+}
+
+
+def make_puzzle(size: int, holes: float, rng: random.Random) -> str:
+    """Return a puzzle of ``size`` with about ``holes`` of its cells empty.
+
+    Args:
+        size (int): The size of the board.
+        holes (float): The fraction of cells to empty.
+        rng (random.Random): The random generator.
+
+    Returns:
+        str: The puzzle as whitespace separated values, ``0`` for an empty cell.
+    """
+    rows, cols = box_shape(size)
+    digits = list(range(1, size + 1))
+    rng.shuffle(digits)
+    values = [
+        digits[(cols * (r % rows) + r // rows + c) % size]
+        for r in range(size)
+        for c in range(size)
+    ]
+    for idx in rng.sample(range(size * size), int(holes * size * size)):
+        values[idx] = 0
+    return " ".join(map(str, values))
+
+
+def run(
+    size: int,
+    holes: float,
+    seed: int,
+    solver: Callable[[], Solver],
+) -> tuple[float, float, bool]:
+    """Build and solve one puzzle of ``size``.
+
+    Args:
+        size (int): The size of the board.
+        holes (float): The fraction of cells to empty.
+        seed (int): The random seed.
+        solver (Callable[[], Solver]): Builds the solver to time.
+
+    Returns:
+        tuple[float, float, bool]:
+            The build time, the solve time and whether the board was solved.
+    """
+    puzzle = make_puzzle(size, holes, random.Random(seed))
+    start = time.perf_counter()
+    board = Board(size)
+    board.load_from_string(puzzle)
+    built = time.perf_counter()
+    solved = solver().apply(board)
+    return built - start, time.perf_counter() - built, solved
+
+
+def main() -> None:
+    """Parse the arguments and print one line per size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 9, 16, 25])
+    parser.add_argument("--holes", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="backtracking")
+    args = parser.parse_args()
+    # Logging would dominate the timings
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'size':>4} {'build (s)':>10} {'solve (s)':>10}  solved")
+    for size in args.sizes:
+        build, solve, solved = run(size, args.holes, args.seed, SOLVERS[args.solver])
+        print(f"{size:>4} {build:>10.3f} {solve:>10.3f}  {solved}")
+
+
+if __name__ == "__main__":
+    main()